@@ -6,7 +6,7 @@ Provides REST API endpoints for file operations, spreadsheet analysis, and docum
 import os
 import logging
 from contextlib import asynccontextmanager
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 
 import structlog
 from fastapi import FastAPI, HTTPException, status
@@ -304,6 +304,12 @@ async def health_check():
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.head("/health", include_in_schema=False)
+async def health_check_head():
+    """Health check for clients that only need the status code"""
+    return {"status": "healthy", "version": "1.0.0"}
+
+
 # Versioning and History API Endpoints
 @app.post("/api/aura/initialize", response_model=APIResponse)
 async def initialize_aura_folder():
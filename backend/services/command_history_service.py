@@ -4,6 +4,7 @@ Handles command logging, execution tracking, and history management.
 """
 
 import json
+import heapq
 import asyncio
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
@@ -31,6 +32,9 @@ class CommandHistoryService:
         self.sessions_path = self.history_path / "sessions"
         self.session_id = versioning_service.session_id
 
+        # Running summary totals for the current session (None until loaded)
+        self._session_stats: Optional[Dict[str, Any]] = None
+
         logger.info("Command history service initialized",
                     session_id=self.session_id,
                     history_path=str(self.history_path))
@@ -86,6 +90,10 @@ class CommandHistoryService:
             # Append to commands log (JSONL format)
             await self._append_to_commands_log(command_entry)
 
+            # Update current session summary totals as soon as the entry is
+            # in the log, so a later failure can't leave them behind it
+            self._record_session_stats(command_entry)
+
             # Update session history
             await self._update_session_history(command_entry)
 
@@ -215,12 +223,25 @@ class CommandHistoryService:
             matching_commands = []
             query_lower = query.lower()
 
+            # Raw log lines are pre-filtered before decoding: text fields
+            # appear JSON-escaped in the line and the parsed intent appears
+            # as serialized, so a line containing neither form cannot match.
+            # Non-ASCII queries and lines with \u escapes are always decoded,
+            # since lowercasing an escape does not lowercase its character.
+            line_needle = (json.dumps(query_lower)[1:-1]
+                           if query_lower.isascii() else None)
+
             if not self.commands_log_path.exists():
                 return matching_commands
 
             with open(self.commands_log_path, 'r', encoding='utf-8') as f:
                 for line in f:
                     if line.strip():
+                        if line_needle is not None and '\\u' not in line:
+                            line_lower = line.lower()
+                            if (line_needle not in line_lower
+                                    and query_lower not in line_lower):
+                                continue
                         try:
                             command_data = json.loads(line.strip())
 
@@ -277,9 +298,18 @@ class CommandHistoryService:
         """
         try:
             target_session = session_id or self.session_id
-            session_commands = await self.get_command_history(session_id=target_session)
 
-            if not session_commands:
+            if target_session == self.session_id:
+                # Running totals are kept up to date by log_command_execution
+                if self._session_stats is None:
+                    self._session_stats = self._scan_session_stats(
+                        target_session)
+                stats = self._session_stats
+            else:
+                stats = self._scan_session_stats(target_session)
+
+            total_commands = stats["total_commands"]
+            if not total_commands:
                 return {
                     "session_id": target_session,
                     "total_commands": 0,
@@ -291,37 +321,22 @@ class CommandHistoryService:
                     "end_time": None
                 }
 
-            # Calculate statistics
-            total_commands = len(session_commands)
-            successful_commands = sum(
-                1 for cmd in session_commands if cmd.get('success', False))
-            failed_commands = total_commands - successful_commands
-            total_duration = sum(cmd.get('execution_duration', 0.0)
-                                 for cmd in session_commands)
-
-            # Collect unique affected files
-            affected_files = set()
-            for cmd in session_commands:
-                affected_files.update(cmd.get('affected_files', []))
-
-            # Get time range
-            timestamps = [cmd.get('timestamp')
-                          for cmd in session_commands if cmd.get('timestamp')]
-            start_time = min(timestamps) if timestamps else None
-            end_time = max(timestamps) if timestamps else None
+            successful_commands = stats["successful_commands"]
+            total_duration = stats["total_duration"]
+            affected_files = stats["affected_files"]
 
             summary = {
                 "session_id": target_session,
                 "total_commands": total_commands,
                 "successful_commands": successful_commands,
-                "failed_commands": failed_commands,
-                "success_rate": successful_commands / total_commands if total_commands > 0 else 0.0,
+                "failed_commands": total_commands - successful_commands,
+                "success_rate": successful_commands / total_commands,
                 "total_duration": total_duration,
-                "average_duration": total_duration / total_commands if total_commands > 0 else 0.0,
+                "average_duration": total_duration / total_commands,
                 "affected_files": list(affected_files),
                 "unique_files_count": len(affected_files),
-                "start_time": start_time,
-                "end_time": end_time
+                "start_time": stats["start_time"],
+                "end_time": stats["end_time"]
             }
 
             logger.debug("Session summary generated",
@@ -336,6 +351,77 @@ class CommandHistoryService:
                          session_id=session_id, error=str(e))
             raise RuntimeError(f"Failed to get session summary: {str(e)}")
 
+    def _scan_session_stats(self, session_id: str) -> Dict[str, Any]:
+        """Aggregate session statistics from the commands log
+
+        Args:
+            session_id: Session ID to aggregate
+
+        Returns:
+            Running totals in the shape kept for the current session
+        """
+        # Accumulate the totals in a single pass over the log
+        total_commands = 0
+        successful_commands = 0
+        total_duration = 0.0
+        affected_files = set()
+        start_time = None
+        end_time = None
+
+        if self.commands_log_path.exists():
+            with open(self.commands_log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        command_data = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if command_data.get('session_id') != session_id:
+                        continue
+
+                    total_commands += 1
+                    if command_data.get('success', False):
+                        successful_commands += 1
+                    total_duration += command_data.get(
+                        'execution_duration', 0.0)
+                    affected_files.update(
+                        command_data.get('affected_files', []))
+
+                    timestamp = command_data.get('timestamp')
+                    if timestamp:
+                        if start_time is None or timestamp < start_time:
+                            start_time = timestamp
+                        if end_time is None or timestamp > end_time:
+                            end_time = timestamp
+
+        return {
+            "total_commands": total_commands,
+            "successful_commands": successful_commands,
+            "total_duration": total_duration,
+            "affected_files": affected_files,
+            "start_time": start_time,
+            "end_time": end_time
+        }
+
+    def _record_session_stats(self, command_entry: CommandHistoryEntry):
+        """Fold a newly logged command into the current session totals"""
+        stats = self._session_stats
+        if stats is None:
+            # Loaded lazily from the log on the next summary request
+            return
+
+        timestamp = command_entry.timestamp.isoformat()
+        stats["total_commands"] += 1
+        if command_entry.success:
+            stats["successful_commands"] += 1
+        stats["total_duration"] += command_entry.execution_duration
+        stats["affected_files"].update(command_entry.affected_files)
+        if stats["start_time"] is None or timestamp < stats["start_time"]:
+            stats["start_time"] = timestamp
+        if stats["end_time"] is None or timestamp > stats["end_time"]:
+            stats["end_time"] = timestamp
+
     async def export_command_history(self,
                                      format_type: str = "json",
                                      session_id: Optional[str] = None,
@@ -535,11 +621,15 @@ class CommandHistoryService:
             commands = [cmd for cmd in commands
                         if cmd.get('timestamp', '') >= cutoff_iso]
 
-            # Limit by count (keep most recent)
+            # Limit by count (keep most recent, in original log order)
             if len(commands) > max_commands:
-                commands.sort(key=lambda x: x.get(
-                    'timestamp', ''), reverse=True)
-                commands = commands[:max_commands]
+                newest = heapq.nlargest(max_commands, commands,
+                                        key=lambda x: x.get('timestamp', ''))
+                keep = {id(cmd) for cmd in newest}
+                commands = [cmd for cmd in commands if id(cmd) in keep]
+
+            # Trimmed commands may belong to the current session
+            self._session_stats = None
 
             # Rewrite commands log
             with open(self.commands_log_path, 'w', encoding='utf-8') as f:
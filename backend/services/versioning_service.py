@@ -6,7 +6,9 @@ Handles file versioning, command history, and state management for the .aura fol
 import os
 import json
 import hashlib
+import mmap
 import shutil
+import sys
 import asyncio
 from datetime import datetime, timezone
 from pathlib import Path
@@ -15,8 +17,24 @@ from dataclasses import dataclass, asdict
 from enum import Enum
 import structlog
 
+# Optional imports for copy-on-write version storage
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
 logger = structlog.get_logger(__name__)
 
+# Read size used when hashlib.file_digest is unavailable (Python < 3.11)
+CHECKSUM_CHUNK_SIZE = 1024 * 1024
+
+# Linux ioctl request for a reflink (copy-on-write) clone, from <linux/fs.h>
+FICLONE = 0x40049409
+
+# Buffer size for the portable copy fallback
+COPY_BUFFER_SIZE = 1024 * 1024
+
 
 class OperationType(Enum):
     CREATE = "create"
@@ -208,12 +226,17 @@ class VersioningService:
             version_dir.mkdir(parents=True, exist_ok=True)
 
             # Copy file content
+            # Copy file content and checksum it off the event loop so that
+            # concurrent create_file_version calls overlap their file I/O
             content_path = version_dir / "content"
-            shutil.copy2(file_path, content_path)
+            _, checksum = await asyncio.gather(
+                asyncio.to_thread(self._copy_file_content,
+                                  file_path, content_path),
+                self._calculate_file_checksum(file_path)
+            )
 
             # Calculate file metadata
             file_size = file_path.stat().st_size
-            checksum = await self._calculate_file_checksum(file_path)
 
             # Create version metadata
             version = FileVersion(
@@ -318,6 +341,18 @@ class VersioningService:
             if not content_path.exists():
                 raise FileNotFoundError(f"Version not found: {version_id}")
 
+            # Load version metadata
+            metadata_path = version_dir / "metadata.json"
+            with open(metadata_path, 'r', encoding='utf-8') as f:
+                version_data = json.load(f)
+
+            # Refuse to restore content that no longer matches its checksum
+            expected_checksum = version_data.get('checksum')
+            if expected_checksum and not await asyncio.to_thread(
+                    self._verify_version_content, content_path, expected_checksum):
+                raise ValueError(
+                    f"Checksum mismatch for version: {version_id}")
+
             # Create a new version of the current file before restoring
             if Path(file_path).exists():
                 await self.create_file_version(
@@ -327,12 +362,8 @@ class VersioningService:
                 )
 
             # Restore the file
-            shutil.copy2(content_path, file_path)
-
-            # Load version metadata
-            metadata_path = version_dir / "metadata.json"
-            with open(metadata_path, 'r', encoding='utf-8') as f:
-                version_data = json.load(f)
+            await asyncio.to_thread(
+                self._copy_file_content, content_path, Path(file_path))
 
             logger.info("File restored successfully",
                         file_path=file_path,
@@ -376,13 +407,89 @@ class VersioningService:
         """Create hash of file path for directory structure"""
         return hashlib.sha256(file_path.encode('utf-8')).hexdigest()[:16]
 
+    def _copy_file_content(self, src: Path, dst: Path):
+        """Copy file content and metadata, avoiding userspace copies where possible
+
+        Tries a reflink clone (BTRFS/XFS), then os.copy_file_range, then
+        os.sendfile, and falls back to a buffered copy (e.g. on Windows).
+        """
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+            if not self._copy_fd_in_kernel(src_fd, dst_fd, os.fstat(src_fd).st_size):
+                shutil.copyfileobj(fsrc, fdst, COPY_BUFFER_SIZE)
+        shutil.copystat(src, dst)
+
+    def _copy_fd_in_kernel(self, src_fd: int, dst_fd: int, size: int) -> bool:
+        """Copy between file descriptors without a userspace buffer
+
+        Returns:
+            True if the content was copied, False if no kernel path worked
+        """
+        if FCNTL_AVAILABLE:
+            try:
+                fcntl.ioctl(dst_fd, FICLONE, src_fd)
+                return True
+            except OSError:
+                pass
+
+        kernel_copies = []
+        if hasattr(os, "copy_file_range"):
+            kernel_copies.append(
+                lambda offset, count: os.copy_file_range(src_fd, dst_fd, count))
+        # Only Linux sendfile copies file to file; macOS/BSD need a socket as the
+        # destination and reject a None offset
+        if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+            kernel_copies.append(
+                lambda offset, count: os.sendfile(dst_fd, src_fd, offset, count))
+
+        for copy_chunk in kernel_copies:
+            try:
+                remaining = size
+                while remaining > 0:
+                    sent = copy_chunk(size - remaining, remaining)
+                    if sent == 0:
+                        break
+                    remaining -= sent
+                if remaining == 0:
+                    return True
+            except OSError:
+                # EXDEV/ENOTSUP/ENOSYS/EINVAL: try the next strategy
+                pass
+
+            # Rewind both files before trying the next strategy
+            os.lseek(src_fd, 0, os.SEEK_SET)
+            os.lseek(dst_fd, 0, os.SEEK_SET)
+            os.ftruncate(dst_fd, 0)
+
+        return False
+
     async def _calculate_file_checksum(self, file_path: Path) -> str:
         """Calculate SHA-256 checksum of file"""
-        hash_sha256 = hashlib.sha256()
+        return await asyncio.to_thread(self._sha256_file, file_path)
+
+    def _sha256_file(self, file_path: Path) -> str:
+        """Hash file contents with SHA-256 (blocking)"""
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
+            # Python 3.11+ hashes the file in C without per-chunk bytes objects
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, "sha256").hexdigest()
+
+            hash_sha256 = hashlib.sha256()
+            for chunk in iter(lambda: f.read(CHECKSUM_CHUNK_SIZE), b""):
                 hash_sha256.update(chunk)
-        return hash_sha256.hexdigest()
+            return hash_sha256.hexdigest()
+
+    def _verify_version_content(self, content_path: Path, expected_checksum: str) -> bool:
+        """Check stored version content against its recorded checksum
+
+        The content is memory-mapped so the page cache is hashed directly
+        instead of being read into a Python bytes object first.
+        """
+        with open(content_path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return hashlib.sha256(b"").hexdigest() == expected_checksum
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return hashlib.sha256(mapped).hexdigest() == expected_checksum
 
     async def _create_initial_config(self):
         """Create initial configuration files"""
@@ -21,6 +21,11 @@ class TestHealthCheck:
         assert response.status_code == 200
         assert response.json()["status"] == "healthy"
 
+    def test_health_check_head(self):
+        response = client.head("/health")
+        assert response.status_code == 200
+        assert response.content == b""
+
 
 class TestCreateFile:
     """Test file creation endpoint"""
@@ -7,6 +7,7 @@ import tempfile
 import shutil
 import json
 import asyncio
+import hashlib
 from pathlib import Path
 from datetime import datetime, timezone
 
@@ -96,6 +97,10 @@ class TestVersioningService:
         content_file = version_dir / "content"
         assert content_file.read_text(encoding='utf-8') == "Initial content"
 
+        # Verify checksum matches the file content
+        expected_checksum = hashlib.sha256(b"Initial content").hexdigest()
+        assert result["checksum"] == expected_checksum
+
         # Verify metadata
         metadata_file = version_dir / "metadata.json"
         with open(metadata_file, 'r', encoding='utf-8') as f:
@@ -173,6 +178,25 @@ class TestVersioningService:
                 str(test_file), "non_existent_version_id"
             )
 
+    async def test_restore_rejects_corrupted_version(self, versioning_service, test_file):
+        """Test that restore refuses content whose checksum no longer matches"""
+        version_result = await versioning_service.create_file_version(
+            str(test_file), "Initial version", OperationType.CREATE
+        )
+
+        # Tamper with the stored version content
+        content_file = Path(version_result["version_dir"]) / "content"
+        content_file.write_text("Tampered content", encoding='utf-8')
+        test_file.write_text("Modified content", encoding='utf-8')
+
+        with pytest.raises(RuntimeError, match="Checksum mismatch"):
+            await versioning_service.restore_file_version(
+                str(test_file), version_result["version_id"]
+            )
+
+        # The working file is left untouched
+        assert test_file.read_text(encoding='utf-8') == "Modified content"
+
     async def test_storage_stats(self, versioning_service, test_file):
         """Test storage statistics calculation"""
         # Create some versions
@@ -302,12 +326,12 @@ class TestCommandHistoryService:
         await command_history_service.log_command_execution(
             "create spreadsheet budget.xlsx",
             {"action": "create_file", "type": "spreadsheet"},
-            1.0, True, ["budget.xlsx"]
+            1.0, True, affected_files=["budget.xlsx"]
         )
         await command_history_service.log_command_execution(
             "analyze sales data",
             {"action": "analyze", "type": "sales"},
-            2.0, True, ["sales.csv"]
+            2.0, True, affected_files=["sales.csv"]
         )
 
         # Search by user input
@@ -353,14 +377,16 @@ class TestCommandHistoryService:
         """Test getting session summary statistics"""
         # Log multiple commands with different outcomes
         await command_history_service.log_command_execution(
-            "command 1", {"action": "test"}, 1.0, True, ["file1.txt"]
+            "command 1", {"action": "test"}, 1.0, True,
+            affected_files=["file1.txt"]
         )
         await command_history_service.log_command_execution(
-            "command 2", {"action": "test"}, 2.0, False, ["file2.txt"]
+            "command 2", {"action": "test"}, 2.0, False,
+            affected_files=["file2.txt"]
         )
         await command_history_service.log_command_execution(
-            "command 3", {"action": "test"}, 1.5, True, [
-                "file1.txt", "file3.txt"]
+            "command 3", {"action": "test"}, 1.5, True,
+            affected_files=["file1.txt", "file3.txt"]
         )
 
         # Get session summary
@@ -378,6 +404,17 @@ class TestCommandHistoryService:
         assert "file2.txt" in summary["affected_files"]
         assert "file3.txt" in summary["affected_files"]
 
+        # Commands logged after the first summary are reflected too
+        await command_history_service.log_command_execution(
+            "command 4", {"action": "test"}, 0.5, False,
+            affected_files=["file4.txt"]
+        )
+        summary = await command_history_service.get_session_summary()
+        assert summary["total_commands"] == 4
+        assert summary["successful_commands"] == 2
+        assert summary["total_duration"] == 5.0
+        assert summary["unique_files_count"] == 4
+
     async def test_export_command_history_json(self, command_history_service):
         """Test exporting command history in JSON format"""
         # Log some commands
@@ -3,53 +3,100 @@
 Check what endpoints are actually available
 """
 
+import asyncio
+
 import requests
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None  # fall back to sending the probes one after another
+
 BASE_URL = "http://localhost:8000"
 
-def check_available_endpoints():
-    """Check what endpoints are available"""
-    print("🔍 Checking available endpoints...")
-    
-    # Try to get OpenAPI docs
+async def probe(session, method, path, read_json=False):
+    """Issue one request and return (status, json body or None, error or None)"""
     try:
-        response = requests.get(f"{BASE_URL}/docs")
-        if response.status_code == 200:
-            print("✅ API docs available at /docs")
-        else:
-            print(f"❌ API docs not available: {response.status_code}")
+        async with session.request(method, f"{BASE_URL}{path}") as response:
+            body = None
+            if read_json and response.status == 200:
+                body = await response.json()
+            return response.status, body, None
     except Exception as e:
-        print(f"❌ Error accessing docs: {e}")
-    
-    # Try to get OpenAPI spec
+        return None, None, e
+
+async def probe_all(probes):
+    """Issue every probe at once on one aiohttp session"""
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(*(probe(session, *args) for args in probes))
+
+def probe_sync(session, method, path, read_json=False):
+    """Blocking version of probe, using a requests session"""
     try:
-        response = requests.get(f"{BASE_URL}/openapi.json")
-        if response.status_code == 200:
-            spec = response.json()
-            print(f"\n📋 Available endpoints:")
-            for path, methods in spec.get('paths', {}).items():
-                for method in methods.keys():
-                    print(f"  {method.upper()} {path}")
-        else:
-            print(f"❌ OpenAPI spec not available: {response.status_code}")
+        response = session.request(method, f"{BASE_URL}{path}")
+        body = None
+        if read_json and response.status_code == 200:
+            body = response.json()
+        return response.status_code, body, None
     except Exception as e:
-        print(f"❌ Error getting OpenAPI spec: {e}")
-    
-    # Test specific endpoints
+        return None, None, e
+
+def probe_all_sync(probes):
+    """Issue the probes one after another on one requests session"""
+    with requests.Session() as session:
+        return [probe_sync(session, *args) for args in probes]
+
+def check_available_endpoints():
+    """Check what endpoints are available"""
+    print("🔍 Checking available endpoints...")
+
     endpoints_to_test = [
         "/health",
         "/api/create-file",
-        "/api/analyze-sheet", 
+        "/api/analyze-sheet",
         "/api/update-sheet"
     ]
-    
+
+    probes = [
+        ("HEAD", "/docs"),
+        ("GET", "/openapi.json", True),
+        *(("HEAD", endpoint) for endpoint in endpoints_to_test)
+    ]
+    # The probes are independent, so issue them all at once when aiohttp is available
+    if aiohttp is not None:
+        results = asyncio.run(probe_all(probes))
+    else:
+        results = probe_all_sync(probes)
+    docs, spec_result, *endpoint_results = results
+
+    # Try to get OpenAPI docs
+    status, _, error = docs
+    if error:
+        print(f"❌ Error accessing docs: {error}")
+    elif status == 200:
+        print("✅ API docs available at /docs")
+    else:
+        print(f"❌ API docs not available: {status}")
+
+    # Try to get OpenAPI spec
+    status, spec, error = spec_result
+    if error:
+        print(f"❌ Error getting OpenAPI spec: {error}")
+    elif status == 200:
+        print(f"\n📋 Available endpoints:")
+        for path, methods in spec.get('paths', {}).items():
+            for method in methods.keys():
+                print(f"  {method.upper()} {path}")
+    else:
+        print(f"❌ OpenAPI spec not available: {status}")
+
+    # Test specific endpoints
     print(f"\n🧪 Testing specific endpoints:")
-    for endpoint in endpoints_to_test:
-        try:
-            response = requests.options(f"{BASE_URL}{endpoint}")
-            print(f"  {endpoint:<20} {response.status_code}")
-        except Exception as e:
-            print(f"  {endpoint:<20} ERROR: {e}")
+    for endpoint, (status, _, error) in zip(endpoints_to_test, endpoint_results):
+        if error:
+            print(f"  {endpoint:<20} ERROR: {error}")
+        else:
+            print(f"  {endpoint:<20} {status}")
 
 if __name__ == "__main__":
-    check_available_endpoints()
\ No newline at end of file
+    check_available_endpoints()
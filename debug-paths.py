@@ -22,32 +22,35 @@ def check_paths():
         Path.cwd() / "backend" / "documents" / "sample-budget.csv",
     ]
     
+    # List each parent directory once and answer every check from that listing
+    contents = {}
+    for path in test_paths:
+        parent = Path(path).parent.absolute()
+        if parent not in contents:
+            try:
+                with os.scandir(parent) as entries:
+                    contents[parent] = {entry.name for entry in entries}
+            except OSError:
+                contents[parent] = None
+
     print("📁 Checking file existence:")
     for path in test_paths:
         path_obj = Path(path)
-        exists = path_obj.exists()
+        exists = path_obj.name in (contents[path_obj.parent.absolute()] or ())
         print(f"  {'✅' if exists else '❌'} {path} -> {path_obj.resolve() if exists else 'NOT FOUND'}")
     
     print()
     print("📂 Directory contents:")
     
-    # Check documents directory
-    docs_path = Path("documents")
-    if docs_path.exists():
-        print(f"  documents/ contents:")
-        for item in docs_path.iterdir():
-            print(f"    - {item.name}")
-    else:
-        print("  documents/ does not exist")
-    
-    # Check backend/documents directory  
-    backend_docs_path = Path("backend/documents")
-    if backend_docs_path.exists():
-        print(f"  backend/documents/ contents:")
-        for item in backend_docs_path.iterdir():
-            print(f"    - {item.name}")
-    else:
-        print("  backend/documents/ does not exist")
+    # Reuse the listings gathered above
+    for docs_path in (Path("documents"), Path("backend/documents")):
+        names = contents.get(docs_path.absolute())
+        if names is not None:
+            print(f"  {docs_path.as_posix()}/ contents:")
+            for name in sorted(names):
+                print(f"    - {name}")
+        else:
+            print(f"  {docs_path.as_posix()}/ does not exist")
 
 if __name__ == "__main__":
     check_paths()
\ No newline at end of file
@@ -5,12 +5,18 @@ Backend connectivity and API test for Aura Desktop Assistant
 
 import requests
 import sys
-import time
+from requests.adapters import HTTPAdapter
+
+from testkit import wait_for
+
+# One keep-alive session shared by every request in this script
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
 
 def test_backend_health():
     """Test backend health endpoint"""
     try:
-        response = requests.get("http://localhost:8000/health", timeout=5)
+        response = SESSION.get("http://localhost:8000/health", timeout=5)
         if response.status_code == 200:
             print("✅ Backend health check passed")
             return True
@@ -28,7 +34,7 @@ def test_file_creation():
             "title": "test-integration.txt",
             "content": "This file was created by Aura integration test!"
         }
-        response = requests.post("http://localhost:8000/create_file", json=payload, timeout=10)
+        response = SESSION.post("http://localhost:8000/create_file", json=payload, timeout=10)
         
         if response.status_code == 200:
             print("✅ File creation API test passed")
@@ -46,16 +52,12 @@ def main():
     print("=" * 40)
     
     # Wait for backend to be ready
-    max_retries = 10
-    for attempt in range(max_retries):
-        if test_backend_health():
-            break
-        if attempt < max_retries - 1:
-            print(f"⏳ Waiting for backend... ({attempt + 1}/{max_retries})")
-            time.sleep(2)
-        else:
+    if not test_backend_health():
+        print("⏳ Waiting for backend...")
+        if not wait_for(SESSION, "http://localhost:8000/health", timeout_s=20):
             print("❌ Backend not responding after retries")
             return False
+        print("✅ Backend health check passed")
     
     # Run API tests
     success = test_file_creation()
@@ -68,5 +70,8 @@ def main():
         return False
 
 if __name__ == "__main__":
-    success = main()
+    try:
+        success = main()
+    finally:
+        SESSION.close()
     sys.exit(0 if success else 1)
\ No newline at end of file
@@ -5,116 +5,133 @@ Tests complete workflows from voice input to file output
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import time
 import sys
 from pathlib import Path
 
+from testkit import demo_budget_path, wait_for
+
+# Optional faster JSON decoding
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BASE_URL = "http://localhost:8000"
+_HEALTH_URL = f"{BASE_URL}/health"
+_FILE_URL = f"{BASE_URL}/create_file"
+_ANALYZE_URL = f"{BASE_URL}/analyze_sheet"
+
+# Request bodies shared by every run
+_INTEG_FILE_PAYLOAD = {
+    "title": "integration-test-document.txt",
+    "content": "This document was created by Aura's integration test suite.\n\nAura demonstrates:\n- Privacy-first AI processing\n- Intelligent natural language understanding\n- Professional desktop integration\n- Extensible architecture\n\nTest completed successfully!"
+}
+_EMPTY_FILE_PAYLOAD = {"title": "", "content": ""}
+
 class AuraIntegrationTester:
     def __init__(self):
-        self.base_url = "http://localhost:8000"
-        self.test_results = []
+        self.test_results = {}
+        self.session = requests.Session()
+        self.session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
     
     def test_api_health(self):
         """Test API health and availability"""
         try:
-            response = requests.get(f"{self.base_url}/health", timeout=5)
+            response = self.session.get(_HEALTH_URL, timeout=5)
             success = response.status_code == 200
-            self.test_results.append(("API Health", success))
+            self.test_results["API Health"] = success
             return success
         except Exception as e:
-            self.test_results.append(("API Health", False))
+            self.test_results["API Health"] = False
             return False
     
     def test_file_operations(self):
         """Test file creation and management"""
         try:
             # Test file creation
-            payload = {
-                "title": "integration-test-document.txt",
-                "content": "This document was created by Aura's integration test suite.\n\nAura demonstrates:\n- Privacy-first AI processing\n- Intelligent natural language understanding\n- Professional desktop integration\n- Extensible architecture\n\nTest completed successfully!"
-            }
-            response = requests.post(f"{self.base_url}/create_file", json=payload, timeout=10)
+            response = self.session.post(_FILE_URL, json=_INTEG_FILE_PAYLOAD, timeout=10)
             
             if response.status_code == 200:
                 # Verify file was created
                 expected_path = Path("documents") / "integration-test-document.txt"
                 if expected_path.exists():
                     content = expected_path.read_text()
-                    if payload["content"] in content:
-                        self.test_results.append(("File Operations", True))
+                    if _INTEG_FILE_PAYLOAD["content"] in content:
+                        self.test_results["File Operations"] = True
                         return True
             
-            self.test_results.append(("File Operations", False))
+            self.test_results["File Operations"] = False
             return False
         except Exception as e:
-            self.test_results.append(("File Operations", False))
+            self.test_results["File Operations"] = False
             return False
     
     def test_spreadsheet_analysis(self):
         """Test spreadsheet analysis capabilities"""
         try:
             # Check if demo spreadsheet exists
-            demo_file = Path("documents/sample-budget.csv")
-            if not demo_file.exists():
-                self.test_results.append(("Spreadsheet Analysis", "SKIPPED - No demo file"))
+            demo_file = demo_budget_path()
+            if demo_file is None:
+                self.test_results["Spreadsheet Analysis"] = "SKIPPED - No demo file"
                 return True
             
             payload = {
-                "path": str(demo_file),
+                "path": demo_file,
                 "operation": "sum",
                 "column": "Amount"
             }
-            response = requests.post(f"{self.base_url}/analyze_sheet", json=payload, timeout=15)
+            response = self.session.post(_ANALYZE_URL, json=payload, timeout=15)
             
             if response.status_code == 200:
-                result = response.json()
+                result = orjson.loads(response.content) if orjson else response.json()
                 # Verify we got a numeric result
                 if "result" in result and isinstance(result["result"], (int, float)):
-                    self.test_results.append(("Spreadsheet Analysis", True))
+                    self.test_results["Spreadsheet Analysis"] = True
                     return True
             
-            self.test_results.append(("Spreadsheet Analysis", False))
+            self.test_results["Spreadsheet Analysis"] = False
             return False
         except Exception as e:
-            self.test_results.append(("Spreadsheet Analysis", False))
+            self.test_results["Spreadsheet Analysis"] = False
             return False
     
     def test_performance_benchmarks(self):
         """Test performance meets requirements"""
         try:
             # Test API response time
-            start_time = time.time()
-            response = requests.get(f"{self.base_url}/health", timeout=5)
-            response_time = (time.time() - start_time) * 1000  # Convert to ms
+            start_time = time.perf_counter_ns()
+            response = self.session.get(_HEALTH_URL, timeout=5)
+            response_time = (time.perf_counter_ns() - start_time) / 1e6  # Convert to ms
             
             # Performance should be under 500ms for health check
             if response.status_code == 200 and response_time < 500:
-                self.test_results.append(("Performance", True))
+                self.test_results["Performance"] = True
                 return True
             else:
-                self.test_results.append(("Performance", False))
+                self.test_results["Performance"] = False
                 return False
         except Exception as e:
-            self.test_results.append(("Performance", False))
+            self.test_results["Performance"] = False
             return False
     
     def test_error_handling(self):
         """Test error handling and resilience"""
         try:
             # Test invalid file creation
-            payload = {"title": "", "content": ""}
-            response = requests.post(f"{self.base_url}/create_file", json=payload, timeout=5)
+            response = self.session.post(_FILE_URL, json=_EMPTY_FILE_PAYLOAD, timeout=5)
             
             # Should handle gracefully (either success with default name or proper error)
             if response.status_code in [200, 400, 422]:
-                self.test_results.append(("Error Handling", True))
+                self.test_results["Error Handling"] = True
                 return True
             else:
-                self.test_results.append(("Error Handling", False))
+                self.test_results["Error Handling"] = False
                 return False
         except Exception as e:
-            self.test_results.append(("Error Handling", False))
+            self.test_results["Error Handling"] = False
             return False
     
     def run_all_tests(self):
@@ -130,40 +147,45 @@ class AuraIntegrationTester:
             ("Error Handling", self.test_error_handling)
         ]
         
+        # Make sure the backend is up before starting
+        if not wait_for(self.session, _HEALTH_URL, timeout_s=10):
+            print("⚠️  Backend not responding, tests will likely fail")
+        
         for test_name, test_func in tests:
             print(f"Running {test_name} test...")
             test_func()
-            time.sleep(1)  # Brief pause between tests
         
         # Print results
         print("\n📊 Integration Test Results:")
-        passed = 0
-        total = 0
-        
-        for test_name, result in self.test_results:
-            if result == True:
+        for test_name, result in self.test_results.items():
+            if result is True:
                 print(f"✅ {test_name}")
-                passed += 1
-                total += 1
-            elif result == False:
+            elif result is False:
                 print(f"❌ {test_name}")
-                total += 1
             else:
                 print(f"⚠️  {test_name}: {result}")
         
+        passed = sum(1 for result in self.test_results.values() if result is True)
+        total = sum(1 for result in self.test_results.values() if isinstance(result, bool))
         print(f"\n🎯 Results: {passed}/{total} tests passed")
         
-        if passed == total:
+        success = passed == total
+        if success:
             print("🎉 All integration tests passed! Aura is ready for demo.")
-            return True
         else:
             print("⚠️  Some tests failed. Check backend logs for details.")
-            return False
+        
+        # Machine-readable summary on the last line for CI
+        print(json.dumps(self.test_results))
+        return success
 
 def main():
     """Main test execution"""
     tester = AuraIntegrationTester()
-    success = tester.run_all_tests()
+    try:
+        success = tester.run_all_tests()
+    finally:
+        tester.session.close()
     return success
 
 if __name__ == "__main__":
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the local test scripts
+"""
+
+import os
+import time
+
+import requests
+
+DEMO_BUDGET = "documents/sample-budget.csv"
+
+def demo_budget_path():
+    """Path of the demo budget if it is a regular file, else None"""
+    return DEMO_BUDGET if os.path.isfile(DEMO_BUDGET) else None
+
+def wait_for(session, url, timeout_s):
+    """Poll url on session until it answers 200 or timeout_s seconds have passed"""
+    start = time.perf_counter()
+    while time.perf_counter() - start < timeout_s:
+        try:
+            if session.get(url, timeout=0.2).ok:
+                return True
+        except requests.RequestException:
+            pass
+        time.sleep(0.05)
+    return False
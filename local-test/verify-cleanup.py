@@ -4,7 +4,56 @@ Verify repository cleanup and structure for competition
 """
 
 import os
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# Build output, dependencies and VCS data that check_file_sizes doesn't descend into
+SKIP_DIRS = frozenset({".git", "node_modules", "__pycache__", "dist", "target", ".venv", "build"})
+
+def _entry_names(path):
+    """Names of the entries in directory path, or an empty set if it can't be listed"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
+def _scan_dir(path):
+    """(path, size in bytes) of the files directly in path, plus its subdirectories to walk"""
+    files = []
+    subdirs = []
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in SKIP_DIRS:
+                            subdirs.append(entry.path)
+                    elif entry.is_file():
+                        files.append((entry.path, entry.stat().st_size))
+                except OSError:
+                    pass
+    except OSError:
+        pass
+    return files, subdirs
+
+def _large_files(file_sizes):
+    """(path, size in MB) for each (path, size in bytes) pair over 10MB"""
+    large_files = []
+    for file_path, size in file_sizes:
+        size_mb = size / (1024 * 1024)
+        if size_mb > 10:  # Files larger than 10MB
+            large_files.append((os.path.normpath(file_path), size_mb))
+    return large_files
+
+def _large_files_under(top):
+    """Walk top, skipping SKIP_DIRS and directory symlinks, and return its large files"""
+    file_sizes = []
+    stack = [top]
+    while stack:
+        files, subdirs = _scan_dir(stack.pop())
+        file_sizes.extend(files)
+        stack.extend(subdirs)
+    return _large_files(file_sizes)
 
 def check_repository_structure():
     """Verify the repository has the correct professional structure"""
@@ -57,11 +106,13 @@ def check_repository_structure():
     ]
     
     issues = []
+    # One directory listing answers every existence check below
+    present = _entry_names(".")
     
     # Check required directories
     print("\n📁 Checking Required Directories:")
     for dir_name in required_dirs:
-        if Path(dir_name).exists():
+        if dir_name in present:
             print(f"✅ {dir_name}/")
         else:
             print(f"❌ {dir_name}/ - MISSING")
@@ -70,7 +121,7 @@ def check_repository_structure():
     # Check required files
     print("\n📄 Checking Required Files:")
     for file_name in required_files:
-        if Path(file_name).exists():
+        if file_name in present:
             print(f"✅ {file_name}")
         else:
             print(f"❌ {file_name} - MISSING")
@@ -79,7 +130,7 @@ def check_repository_structure():
     # Check unwanted files are removed
     print("\n🗑️  Checking Unwanted Files Removed:")
     for file_name in unwanted_files:
-        if Path(file_name).exists():
+        if file_name in present:
             print(f"❌ {file_name} - SHOULD BE REMOVED")
             issues.append(f"Unwanted file still exists: {file_name}")
         else:
@@ -88,7 +139,7 @@ def check_repository_structure():
     # Check unwanted directories are removed
     print("\n📂 Checking Unwanted Directories Removed:")
     for dir_name in unwanted_dirs:
-        if Path(dir_name).exists():
+        if dir_name in present:
             print(f"❌ {dir_name}/ - SHOULD BE REMOVED")
             issues.append(f"Unwanted directory still exists: {dir_name}")
         else:
@@ -116,10 +167,10 @@ def check_local_test_structure():
     ]
     
     issues = []
+    present = _entry_names("local-test")
     
     for file_name in local_test_files:
-        file_path = Path("local-test") / file_name
-        if file_path.exists():
+        if file_name in present:
             print(f"✅ local-test/{file_name}")
         else:
             print(f"❌ local-test/{file_name} - MISSING")
@@ -131,16 +182,14 @@ def check_file_sizes():
     """Check for any unusually large files that might need cleanup"""
     print("\n📊 Checking File Sizes:")
     
-    large_files = []
-    
-    for file_path in Path(".").rglob("*"):
-        if file_path.is_file():
-            try:
-                size_mb = file_path.stat().st_size / (1024 * 1024)
-                if size_mb > 10:  # Files larger than 10MB
-                    large_files.append((str(file_path), size_mb))
-            except:
-                pass
+    # scandir entries carry their type, so only files need a stat call. The
+    # walk is bound on metadata calls, so each top-level directory gets a thread
+    root_files, top_dirs = _scan_dir(".")
+    large_files = _large_files(root_files)
+    if top_dirs:
+        with ThreadPoolExecutor(max_workers=min(8, len(top_dirs))) as executor:
+            for found in executor.map(_large_files_under, top_dirs):
+                large_files.extend(found)
     
     if large_files:
         print("⚠️  Large files found (>10MB):")
@@ -5,14 +5,71 @@ Python-based alternative that doesn't require Node.js
 """
 
 import json
+import signal
 import sys
+import time
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from typing import Dict, Any, Optional
 
+try:
+    import cachetools
+except ImportError:
+    cachetools = None
+
+# Optional faster JSON; orjson.JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize one JSON-RPC message to UTF-8 bytes"""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode('utf-8')
+
+_loads = orjson.loads if orjson else json.loads
+
+# Read-only tools whose results are memoized, with how long (in seconds) a
+# result stays fresh; tools that change state (create_file, open_item)
+# always go to the backend
+TOOL_CACHE_TTL = {'analyze_sheet': 60, 'summarize_doc': 600}
+# Tools that can overwrite a file the cached results were computed from;
+# a successful call drops every cached result
+TOOL_CACHE_INVALIDATED_BY = frozenset({'create_file'})
+TOOL_CACHE_SIZE = 256
+
+# Set MCP_DEBUG to log every received and sent message to stderr
+DEBUG = bool(os.environ.get('MCP_DEBUG'))
+
+class ToolCallError(Exception):
+    """A tool call failed; the message is the text returned to the client"""
+
+class _FIFOCache(dict):
+    """Bounded dict that drops its oldest entry when full, used without cachetools"""
+    def __init__(self, maxsize: int):
+        super().__init__()
+        self.maxsize = maxsize
+    
+    def __setitem__(self, key, value):
+        if key not in self and len(self) >= self.maxsize:
+            del self[next(iter(self))]
+        super().__setitem__(key, value)
+
 class SimpleMCPServer:
     def __init__(self):
         self.base_url = os.getenv('AURA_API_URL', 'http://localhost:8000')
+        # Keep connections to the backend alive across tool calls
+        self.http = requests.Session()
+        self.http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=16))
+        # (tool, arguments) -> (expiry, result); LFU keeps the handful of
+        # documents an agent keeps coming back to
+        if cachetools:
+            self._tool_cache = cachetools.LFUCache(maxsize=TOOL_CACHE_SIZE)
+        else:
+            self._tool_cache = _FIFOCache(TOOL_CACHE_SIZE)
         self.tools = [
             {
                 "name": "create_file",
@@ -65,61 +122,34 @@ class SimpleMCPServer:
                 }
             }
         ]
+        # The tool list never changes, so build its result and JSON text once
+        self._tools_list_result = {"tools": self.tools}
+        self._tools_list_bytes = _dumps(self._tools_list_result)
+        # JSON-RPC method -> handler returning the "result" payload
+        self._handlers = {
+            'initialize': self._handle_initialize,
+            'tools/list': self._handle_tools_list,
+            'tools/call': self._handle_tools_call,
+            'ping': self._handle_ping
+        }
     
     def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         method = request.get('method')
         request_id = request.get('id')
         
-        try:
-            if method == 'initialize':
-                return {
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {"tools": {"listChanged": False}},
-                        "serverInfo": {
-                            "name": "aura-desktop-assistant",
-                            "version": "1.0.0"
-                        }
-                    }
-                }
-            
-            elif method == 'tools/list':
-                return {
-                    "id": request_id,
-                    "result": {"tools": self.tools}
-                }
-            
-            elif method == 'tools/call':
-                params = request.get('params', {})
-                tool_name = params.get('name')
-                arguments = params.get('arguments', {})
-                
-                result = self.call_tool(tool_name, arguments)
-                
-                return {
-                    "id": request_id,
-                    "result": {
-                        "content": [{
-                            "type": "text",
-                            "text": result
-                        }],
-                        "isError": "❌" in result
-                    }
-                }
-            
-            elif method == 'ping':
-                return {"id": request_id, "result": {"status": "ok"}}
-            
-            else:
-                return {
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
+        # Non-string methods (malformed requests) can't be dict keys; report them as unknown
+        handler = self._handlers.get(method) if isinstance(method, str) else None
+        if handler is None:
+            return {
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
                 }
+            }
         
+        try:
+            return {"id": request_id, "result": handler(request.get('params', {}))}
         except Exception as e:
             return {
                 "id": request_id,
@@ -129,6 +159,37 @@ class SimpleMCPServer:
                 }
             }
     
+    def _handle_initialize(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self._tool_cache.clear()
+        return {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {"tools": {"listChanged": False}},
+            "serverInfo": {
+                "name": "aura-desktop-assistant",
+                "version": "1.0.0"
+            }
+        }
+    
+    def _handle_tools_list(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._tools_list_result
+    
+    def _handle_tools_call(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        tool_name = params.get('name')
+        arguments = params.get('arguments', {})
+        
+        result = self.call_tool(tool_name, arguments)
+        
+        return {
+            "content": [{
+                "type": "text",
+                "text": result
+            }],
+            "isError": "❌" in result
+        }
+    
+    def _handle_ping(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {"status": "ok"}
+    
     def call_tool(self, tool_name: str, arguments: Dict[str, Any]) -> str:
         endpoint_map = {
             'create_file': '/create_file',
@@ -141,8 +202,30 @@ class SimpleMCPServer:
         if not endpoint:
             return f"❌ Unknown tool: {tool_name}"
         
+        ttl = TOOL_CACHE_TTL.get(tool_name)
+        try:
+            if ttl is None:
+                result = self._run_tool(tool_name, endpoint, arguments)
+                if tool_name in TOOL_CACHE_INVALIDATED_BY:
+                    self._tool_cache.clear()
+                return result
+            
+            key = (tool_name, json.dumps(arguments, sort_keys=True))
+            now = time.monotonic()
+            cached = self._tool_cache.get(key)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            
+            # Failures raise ToolCallError, so they are never cached
+            result = self._run_tool(tool_name, endpoint, arguments)
+            self._tool_cache[key] = (now + ttl, result)
+            return result
+        except ToolCallError as e:
+            return str(e)
+    
+    def _run_tool(self, tool_name: str, endpoint: str, arguments: Dict[str, Any]) -> str:
         try:
-            response = requests.post(
+            response = self.http.post(
                 f"{self.base_url}{endpoint}",
                 json=arguments,
                 timeout=30
@@ -157,24 +240,40 @@ class SimpleMCPServer:
                 else:
                     return f"✅ {data.get('message', 'Operation completed successfully')}"
             else:
-                return f"❌ HTTP {response.status_code}: {response.text}"
+                raise ToolCallError(f"❌ HTTP {response.status_code}: {response.text}")
         
+        except ToolCallError:
+            raise
         except requests.exceptions.ConnectionError:
-            return f"❌ Cannot connect to Aura backend at {self.base_url}. Make sure the server is running."
+            raise ToolCallError(f"❌ Cannot connect to Aura backend at {self.base_url}. Make sure the server is running.")
         except requests.exceptions.Timeout:
-            return f"❌ Request timed out. The operation took too long."
+            raise ToolCallError(f"❌ Request timed out. The operation took too long.")
         except Exception as e:
-            return f"❌ Error: {str(e)}"
+            raise ToolCallError(f"❌ Error: {str(e)}")
+    
+    def _tools_list_response(self, request_id: Any) -> bytes:
+        """tools/list reply as JSON bytes, splicing in the pre-serialized tool list"""
+        return b'{"id":' + _dumps(request_id) + b',"result":' + self._tools_list_bytes + b'}'
+    
+    def _write_line(self, message: bytes) -> None:
+        """Write one JSON message to stdout as a single line and flush it"""
+        sys.stdout.buffer.write(message + b'\n')
+        sys.stdout.buffer.flush()
     
     def start(self):
         print("Aura Desktop Assistant MCP Server (Python) starting...", file=sys.stderr)
         print(f"Backend URL: {self.base_url}", file=sys.stderr)
         print("Ready for requests", file=sys.stderr)
         
+        # Work on the raw byte streams: the JSON layer reads and produces UTF-8
+        # bytes, so no text-layer codec passes are needed per message
+        stdin = sys.stdin.buffer
+        # Turn SIGTERM into SystemExit so the finally block below still runs
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
         try:
             while True:
                 try:
-                    line = sys.stdin.readline()
+                    line = stdin.readline()
                     if not line:  # EOF
                         break
                     
@@ -182,43 +281,45 @@ class SimpleMCPServer:
                     if not line:
                         continue
                     
-                    print(f"Received: {line}", file=sys.stderr)
-                    
-                    request = json.loads(line)
-                    response = self.handle_request(request)
+                    if DEBUG:
+                        print(f"Received: {line.decode('utf-8', 'replace')}", file=sys.stderr)
                     
-                    response_json = json.dumps(response)
-                    print(f"Sending: {response_json}", file=sys.stderr)
+                    request = _loads(line)
+                    if request.get('method') == 'tools/list':
+                        response_json = self._tools_list_response(request.get('id'))
+                    else:
+                        response_json = _dumps(self.handle_request(request))
+                    if DEBUG:
+                        print(f"Sending: {response_json.decode('utf-8')}", file=sys.stderr)
                     
-                    print(response_json)
-                    sys.stdout.flush()
+                    self._write_line(response_json)
                     
                 except json.JSONDecodeError as e:
-                    error_response = json.dumps({
+                    error_response = _dumps({
                         "error": {
                             "code": -32700,
                             "message": f"Parse error: {str(e)}"
                         }
                     })
-                    print(f"Parse error, sending: {error_response}", file=sys.stderr)
-                    print(error_response)
-                    sys.stdout.flush()
+                    print(f"Parse error, sending: {error_response.decode('utf-8')}", file=sys.stderr)
+                    self._write_line(error_response)
                     
                 except Exception as e:
-                    error_response = json.dumps({
+                    error_response = _dumps({
                         "error": {
                             "code": -32603,
                             "message": f"Internal error: {str(e)}"
                         }
                     })
-                    print(f"Internal error, sending: {error_response}", file=sys.stderr)
-                    print(error_response)
-                    sys.stdout.flush()
+                    print(f"Internal error, sending: {error_response.decode('utf-8')}", file=sys.stderr)
+                    self._write_line(error_response)
         
         except KeyboardInterrupt:
             print("MCP Server shutting down...", file=sys.stderr)
         except Exception as e:
             print(f"Fatal error: {str(e)}", file=sys.stderr)
+        finally:
+            self.http.close()
 
 if __name__ == "__main__":
     server = SimpleMCPServer()
@@ -5,10 +5,30 @@ Test script for the Python MCP Server
 
 import subprocess
 import json
-import time
+import selectors
 import sys
 import os
 
+RESPONSE_TIMEOUT_S = 2
+
+def read_responses(process, selector, count):
+    """Read up to count response lines, stopping early if the server is silent for RESPONSE_TIMEOUT_S"""
+    # Windows can't select() on pipes, so there the reads just block
+    if selector is None:
+        return [process.stdout.readline() for _ in range(count)]
+    
+    # Read the raw fd so lines never sit unseen in the text wrapper's buffer
+    # while select() reports the pipe as empty
+    lines = []
+    pending = b''
+    while len(lines) < count and selector.select(RESPONSE_TIMEOUT_S):
+        chunk = os.read(process.stdout.fileno(), 65536)
+        if not chunk:  # EOF
+            break
+        *complete, pending = (pending + chunk).split(b'\n')
+        lines.extend(line.decode('utf-8') for line in complete)
+    return lines
+
 def test_mcp_server():
     print("Testing Python MCP Server...")
     
@@ -22,14 +42,17 @@ def test_mcp_server():
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
-            bufsize=0
+            bufsize=1
         )
         
-        print("Server started, waiting for initialization...")
-        time.sleep(1)
+        # Replies are awaited with a deadline rather than a fixed startup sleep
+        selector = None
+        if sys.platform != "win32":
+            selector = selectors.DefaultSelector()
+            selector.register(process.stdout, selectors.EVENT_READ)
+        
+        print("Server started")
         
-        # Test 1: Initialize
-        print("\n1. Testing initialize...")
         init_request = {
             "method": "initialize",
             "params": {
@@ -40,61 +63,44 @@ def test_mcp_server():
             "id": 1
         }
         
-        process.stdin.write(json.dumps(init_request) + '\n')
-        process.stdin.flush()
-        
-        # Read response
-        response_line = process.stdout.readline()
-        if response_line:
-            try:
-                response = json.loads(response_line.strip())
-                print(f"Initialize response: {json.dumps(response, indent=2)}")
-            except json.JSONDecodeError:
-                print(f"Invalid JSON response: {response_line}")
-        else:
-            print("No response received")
-        
-        # Test 2: List tools
-        print("\n2. Testing tools/list...")
         list_request = {
             "method": "tools/list",
             "params": {},
             "id": 2
         }
         
-        process.stdin.write(json.dumps(list_request) + '\n')
-        process.stdin.flush()
-        
-        response_line = process.stdout.readline()
-        if response_line:
-            try:
-                response = json.loads(response_line.strip())
-                print(f"Tools list response: {json.dumps(response, indent=2)}")
-            except json.JSONDecodeError:
-                print(f"Invalid JSON response: {response_line}")
-        else:
-            print("No response received")
-        
-        # Test 3: Ping
-        print("\n3. Testing ping...")
         ping_request = {
             "method": "ping",
             "params": {},
             "id": 3
         }
         
-        process.stdin.write(json.dumps(ping_request) + '\n')
+        tests = [
+            ("initialize", "Initialize", init_request),
+            ("tools/list", "Tools list", list_request),
+            ("ping", "Ping", ping_request)
+        ]
+        
+        # Pipeline the requests so the server works through them while we
+        # wait, then match the replies up by id
+        process.stdin.write(''.join(json.dumps(request) + '\n' for _, _, request in tests))
         process.stdin.flush()
         
-        response_line = process.stdout.readline()
-        if response_line:
+        responses = {}
+        for response_line in read_responses(process, selector, len(tests)):
             try:
                 response = json.loads(response_line.strip())
-                print(f"Ping response: {json.dumps(response, indent=2)}")
-            except json.JSONDecodeError:
+                responses[response.get('id')] = response
+            except (json.JSONDecodeError, AttributeError):
                 print(f"Invalid JSON response: {response_line}")
-        else:
-            print("No response received")
+        
+        for number, (method, label, request) in enumerate(tests, start=1):
+            print(f"\n{number}. Testing {method}...")
+            response = responses.get(request["id"])
+            if response is not None:
+                print(f"{label} response: {json.dumps(response, indent=2)}")
+            else:
+                print("No response received")
         
         # Clean up
         process.stdin.close()
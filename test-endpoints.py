@@ -4,16 +4,34 @@ Test script to verify all API endpoints are working correctly
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
-import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# json.dumps escapes non-ASCII by default, so either encoder's output can be sent as the body
+_dumps = orjson.dumps if orjson else json.dumps
+_loads = orjson.loads if orjson else json.loads
 
 BASE_URL = "http://localhost:8000"
+_HEALTH_URL = f"{BASE_URL}/health"
+_CREATE_FILE_URL = f"{BASE_URL}/api/create-file"
+_ANALYZE_SHEET_URL = f"{BASE_URL}/api/analyze-sheet"
+_UPDATE_SHEET_URL = f"{BASE_URL}/api/update-sheet"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# One keep-alive session for every test instead of a new connection per request
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
 
 def test_health():
     """Test health endpoint"""
     try:
-        response = requests.get(f"{BASE_URL}/health")
-        print(f"✅ Health check: {response.status_code} - {response.json()}")
+        response = SESSION.get(_HEALTH_URL)
+        print(f"✅ Health check: {response.status_code} - {_loads(response.content)}")
         return response.status_code == 200
     except Exception as e:
         print(f"❌ Health check failed: {e}")
@@ -27,13 +45,13 @@ def test_create_file():
             "content": "This is a test file",
             "path": "documents"
         }
-        response = requests.post(f"{BASE_URL}/api/create-file", json=data)
+        response = SESSION.post(_CREATE_FILE_URL, data=_dumps(data), headers=_JSON_HEADERS)
         print(f"✅ Create file: {response.status_code}")
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             print(f"   Created: {result['data']['file_path']}")
         elif response.status_code == 422:
-            error_detail = response.json()
+            error_detail = _loads(response.content)
             print(f"   Validation error: {error_detail}")
         return response.status_code in [200, 409]  # 409 = file already exists
     except Exception as e:
@@ -48,10 +66,10 @@ def test_analyze_sheet():
             "op": "sum",
             "column": "Total_Monthly"
         }
-        response = requests.post(f"{BASE_URL}/api/analyze-sheet", json=data)
+        response = SESSION.post(_ANALYZE_SHEET_URL, data=_dumps(data), headers=_JSON_HEADERS)
         print(f"✅ Analyze sheet: {response.status_code}")
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             print(f"   Result: {result['result']} for {result['matched_column']}")
         elif response.status_code == 404:
             print(f"   File not found - this is expected if sample-budget.csv doesn't exist")
@@ -70,22 +88,22 @@ def test_update_sheet():
             "sample-budget.csv"
         ]
         
-        for path in paths_to_try:
-            data = {
-                "path": path,
-                "operation": "salary_increase",
-                "percentage": 10.0
-            }
-            response = requests.post(f"{BASE_URL}/api/update-sheet", json=data)
-            print(f"✅ Update sheet (path: {path}): {response.status_code}")
-            if response.status_code == 200:
-                result = response.json()
-                print(f"   Updated: {result['data']['output_file']}")
-                return True
-            elif response.status_code == 404:
-                continue  # Try next path
-        
-        print(f"   File not found with any path - check file location")
+        # The backend looks the file name up under documents/ and backend/documents/
+        # itself, so if the first format misses, the others miss as well
+        path = paths_to_try[0]
+        data = {
+            "path": path,
+            "operation": "salary_increase",
+            "percentage": 10.0
+        }
+        response = SESSION.post(_UPDATE_SHEET_URL, data=_dumps(data), headers=_JSON_HEADERS)
+        print(f"✅ Update sheet (path: {path}): {response.status_code}")
+        if response.status_code == 200:
+            result = _loads(response.content)
+            print(f"   Updated: {result['data']['output_file']}")
+            return True
+        elif response.status_code == 404:
+            print(f"   File not found with any path - check file location")
         return False
     except Exception as e:
         print(f"❌ Update sheet failed: {e}")
@@ -110,7 +128,6 @@ def main():
         if test_func():
             passed += 1
         print()
-        time.sleep(0.5)
     
     print(f"📊 Test Results: {passed}/{total} tests passed")
     
@@ -120,4 +137,5 @@ def main():
         print("⚠️  Some tests failed. Check the backend service.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    with SESSION:
+        main()
\ No newline at end of file
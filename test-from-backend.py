@@ -4,19 +4,39 @@ Test update endpoint from backend directory context
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# json.dumps escapes non-ASCII by default, so either encoder's output can be sent as the body
+_dumps = orjson.dumps if orjson else json.dumps
+_loads = orjson.loads if orjson else json.loads
+
 # Change to backend directory to match server context
 os.chdir('backend')
 print(f"Testing from: {Path.cwd()}")
-print(f"Sample file exists: {Path('documents/sample-budget.csv').exists()}")
+SAMPLE_EXISTS = Path('documents/sample-budget.csv').exists()
+print(f"Sample file exists: {SAMPLE_EXISTS}")
 
 BASE_URL = "http://localhost:8000"
+_UPDATE_SHEET_URL = f"{BASE_URL}/api/update-sheet"
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=16, max_retries=0))
 
 def test_update_from_backend():
     """Test update endpoint with backend directory context"""
+    if not SAMPLE_EXISTS:
+        print("❌ documents/sample-budget.csv is missing - nothing to update")
+        return False
+    
     try:
         data = {
             "path": "documents/sample-budget.csv",
@@ -25,15 +45,15 @@ def test_update_from_backend():
         }
         
         print(f"Testing update with data: {data}")
-        response = requests.post(f"{BASE_URL}/api/update-sheet", json=data)
+        response = SESSION.post(_UPDATE_SHEET_URL, data=_dumps(data), headers=_JSON_HEADERS)
         print(f"Response status: {response.status_code}")
         
         if response.status_code == 200:
-            result = response.json()
+            result = _loads(response.content)
             print(f"✅ Success! Updated file: {result['data']['output_file']}")
             return True
         else:
-            error_data = response.json()
+            error_data = _loads(response.content)
             print(f"❌ Error: {error_data}")
             return False
             
@@ -42,4 +62,5 @@ def test_update_from_backend():
         return False
 
 if __name__ == "__main__":
-    test_update_from_backend()
\ No newline at end of file
+    with SESSION:
+        test_update_from_backend()
\ No newline at end of file